@@ -26,6 +26,13 @@ type Response struct {
 	RequiresQR   bool     `json:"requires_qr,omitempty"`
 }
 
+// BatchResponse is returned for {"batch": [...]} requests. Results is always
+// serialised, so an empty batch yields "results": [].
+type BatchResponse struct {
+	Status  string      `json:"status"`
+	Results []*Response `json:"results"`
+}
+
 const (
 	defaultReadLimit     = 10
 	defaultListenSeconds = 10.0
@@ -37,6 +44,8 @@ type runPayload struct {
 	ListenSeconds float64 `json:"listen_seconds,omitempty"`
 	FilterChat    string  `json:"filter_chat,omitempty"`
 	IncludeFromMe *bool   `json:"include_from_me,omitempty"`
+	ShowQR        *bool   `json:"show_qr,omitempty"`
+	ForceRelink   bool    `json:"force_relink,omitempty"`
 }
 
 type normalizedConfig struct {
@@ -48,6 +57,8 @@ type normalizedConfig struct {
 	FilterChat     string
 	IncludeFromMe  bool
 	IncludeSet     bool
+	ShowQR         bool
+	ForceRelink    bool
 }
 
 func parseRunPayload(raw string) (runPayload, bool, error) {
@@ -67,6 +78,26 @@ func parseRunPayload(raw string) (runPayload, bool, error) {
 	return runPayload{SendText: raw}, false, nil
 }
 
+// parseBatchPayload extracts the items of a {"batch": [...]} request. The
+// boolean result reports whether raw is a batch request at all.
+func parseBatchPayload(raw string) ([]json.RawMessage, bool, error) {
+	trimmed := strings.TrimSpace(raw)
+	if !strings.HasPrefix(trimmed, "{") || !strings.Contains(trimmed, `"batch"`) {
+		return nil, false, nil
+	}
+
+	var payload struct {
+		Batch []json.RawMessage `json:"batch"`
+	}
+	if err := json.Unmarshal([]byte(trimmed), &payload); err != nil {
+		return nil, true, err
+	}
+	if payload.Batch == nil {
+		return nil, false, nil
+	}
+	return payload.Batch, true, nil
+}
+
 func normalizeConfig(raw string) (normalizedConfig, error) {
 	payload, payloadProvided, err := parseRunPayload(raw)
 	if err != nil {
@@ -91,6 +122,11 @@ func normalizeConfig(raw string) (normalizedConfig, error) {
 		includeSet = true
 	}
 
+	showQR := true
+	if payload.ShowQR != nil {
+		showQR = *payload.ShowQR
+	}
+
 	listenSeconds := payload.ListenSeconds
 	if listenSeconds < 0 {
 		listenSeconds = 0
@@ -122,37 +158,84 @@ func normalizeConfig(raw string) (normalizedConfig, error) {
 		FilterChat:     filterChat,
 		IncludeFromMe:  includeFromMe,
 		IncludeSet:     includeSet,
+		ShowQR:         showQR,
+		ForceRelink:    payload.ForceRelink,
 	}, nil
 }
 
 //export WaRun
 func WaRun(dbURI, phone, message *C.char) *C.char {
+	return marshalResponse(handleRun(dbURI, phone, message), nil)
+}
+
+// WaRunWithLen behaves like WaRun and additionally stores the length of the
+// returned JSON (excluding the trailing NUL) in outLen, so callers can read
+// the buffer in place without scanning or copying it first.
+//
+//export WaRunWithLen
+func WaRunWithLen(dbURI, phone, message *C.char, outLen *C.size_t) *C.char {
+	return marshalResponse(handleRun(dbURI, phone, message), outLen)
+}
+
+func handleRun(dbURI, phone, message *C.char) any {
 	goDBURI := strings.TrimSpace(C.GoString(dbURI))
 	goPhone := strings.TrimSpace(C.GoString(phone))
 	goMessage := C.GoString(message)
+	return handleRequest(goDBURI, goPhone, goMessage)
+}
 
+// handleRequest dispatches a decoded WaRun call to a single run or a batch.
+// It returns a *Response, or a *BatchResponse for valid batch requests.
+func handleRequest(goDBURI, goPhone, goMessage string) any {
+	batch, isBatch, err := parseBatchPayload(goMessage)
+	if !isBatch {
+		return runRequest(goDBURI, goPhone, goMessage)
+	}
+	if err != nil {
+		return &Response{
+			Status: "error",
+			Error:  fmt.Sprintf("invalid batch payload: %v", err),
+		}
+	}
+
+	results := make([]*Response, 0, len(batch))
+	for _, item := range batch {
+		itemMessage := string(item)
+		var text string
+		if json.Unmarshal(item, &text) == nil {
+			itemMessage = text
+		}
+		results = append(results, runRequest(goDBURI, goPhone, itemMessage))
+	}
+	return &BatchResponse{Status: "ok", Results: results}
+}
+
+// runRequest executes a single (non-batch) WaRun request.
+func runRequest(goDBURI, goPhone, goMessage string) *Response {
 	resp := &Response{Status: "ok"}
 
 	cfg, err := normalizeConfig(goMessage)
 	if err != nil {
 		resp.Status = "error"
 		resp.Error = err.Error()
-		return marshalResponse(resp)
+		return resp
 	}
 
 	if goPhone == "" && cfg.FilterChat == "" {
 		resp.Status = "error"
 		resp.Error = "phone number or filter_chat is required"
-		return marshalResponse(resp)
+		return resp
 	}
 
 	waConfig := waclient.Config{
-		DatabaseURI:      goDBURI,
-		PhoneNumber:      goPhone,
-		Chat:             cfg.FilterChat,
-		ReadLimit:        cfg.ReadLimit,
-		IncludeFromMe:    cfg.IncludeFromMe,
-		IncludeFromMeSet: cfg.IncludeSet,
+		DatabaseURI:       goDBURI,
+		PhoneNumber:       goPhone,
+		Chat:              cfg.FilterChat,
+		ReadLimit:         cfg.ReadLimit,
+		IncludeFromMe:     cfg.IncludeFromMe,
+		IncludeFromMeSet:  cfg.IncludeSet,
+		DisableQRPrinting: !cfg.ShowQR,
+		ForceRelink:       cfg.ForceRelink,
 	}
 	if cfg.ShouldSend {
 		waConfig.Message = cfg.SendText
@@ -167,17 +250,20 @@ func WaRun(dbURI, phone, message *C.char) *C.char {
 	if runErr != nil {
 		resp.Status = "error"
 		resp.Error = runErr.Error()
-		return marshalResponse(resp)
+		return resp
 	}
 
 	resp.MessageID = result.MessageID
 	resp.LastMessages = append(resp.LastMessages, result.LastMessages...)
 	resp.RequiresQR = result.RequiresQR
-	return marshalResponse(resp)
+	return resp
 }
 
-func marshalResponse(resp *Response) *C.char {
+func marshalResponse(resp any, outLen *C.size_t) *C.char {
 	data, _ := json.Marshal(resp)
+	if outLen != nil {
+		*outLen = C.size_t(len(data))
+	}
 	return C.CString(string(data))
 }
 
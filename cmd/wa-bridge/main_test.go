@@ -0,0 +1,90 @@
+package main
+
+import (
+	"encoding/json"
+	"strings"
+	"testing"
+)
+
+func TestParseBatchPayload(t *testing.T) {
+	tests := []struct {
+		name      string
+		raw       string
+		wantBatch bool
+		wantErr   bool
+		wantLen   int
+	}{
+		{name: "plain text", raw: "hello batch", wantBatch: false},
+		{name: "single payload", raw: `{"send_text":"hi"}`, wantBatch: false},
+		{name: "text mentioning batch", raw: `{"send_text":"\"batch\""}`, wantBatch: false},
+		{name: "null batch", raw: `{"batch":null}`, wantBatch: false},
+		{name: "empty batch", raw: `{"batch":[]}`, wantBatch: true, wantLen: 0},
+		{name: "two items", raw: `{"batch":[{"send_text":"a"},"b"]}`, wantBatch: true, wantLen: 2},
+		{name: "not an array", raw: `{"batch":{"send_text":"a"}}`, wantBatch: true, wantErr: true},
+		{name: "number", raw: `{"batch":5}`, wantBatch: true, wantErr: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			batch, isBatch, err := parseBatchPayload(tt.raw)
+			if isBatch != tt.wantBatch {
+				t.Fatalf("isBatch = %v, want %v", isBatch, tt.wantBatch)
+			}
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("err = %v, wantErr %v", err, tt.wantErr)
+			}
+			if !tt.wantErr && len(batch) != tt.wantLen {
+				t.Fatalf("len(batch) = %d, want %d", len(batch), tt.wantLen)
+			}
+		})
+	}
+}
+
+func TestHandleRequestEmptyBatch(t *testing.T) {
+	resp, ok := handleRequest("file:test.db", "123", `{"batch":[]}`).(*BatchResponse)
+	if !ok {
+		t.Fatalf("empty batch must produce a *BatchResponse")
+	}
+	if resp.Status != "ok" {
+		t.Fatalf("status = %q, want ok", resp.Status)
+	}
+
+	data, err := json.Marshal(resp)
+	if err != nil {
+		t.Fatalf("marshal: %v", err)
+	}
+	if !strings.Contains(string(data), `"results":[]`) {
+		t.Fatalf("empty batch response must keep the results array, got %s", data)
+	}
+}
+
+func TestHandleRequestInvalidBatch(t *testing.T) {
+	resp, ok := handleRequest("file:test.db", "123", `{"batch":"not a list"}`).(*Response)
+	if !ok {
+		t.Fatalf("invalid batch must produce a plain *Response")
+	}
+	if resp.Status != "error" {
+		t.Fatalf("status = %q, want error", resp.Status)
+	}
+	if !strings.HasPrefix(resp.Error, "invalid batch payload") {
+		t.Fatalf("unexpected error: %q", resp.Error)
+	}
+
+	data, err := json.Marshal(resp)
+	if err != nil {
+		t.Fatalf("marshal: %v", err)
+	}
+	if strings.Contains(string(data), "results") {
+		t.Fatalf("error response must not carry results, got %s", data)
+	}
+}
+
+func TestSingleResponseOmitsResults(t *testing.T) {
+	data, err := json.Marshal(&Response{Status: "ok"})
+	if err != nil {
+		t.Fatalf("marshal: %v", err)
+	}
+	if strings.Contains(string(data), "results") {
+		t.Fatalf("single response must not carry results, got %s", data)
+	}
+}
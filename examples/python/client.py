@@ -5,13 +5,34 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
 
 from python import BridgeError, WhatsAppBridge
 
+DEFAULT_MESSAGE = "Hello from Python!"
+_SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 
-def main(argv: list[str] | None = None) -> int:
+
+def _build_batch(payload: dict, items: list) -> list[dict]:
+    """Merge the command-line ``payload`` into every batch item.
+
+    Item fields win over the command-line defaults; plain strings become
+    ``send_text``. ``force_relink`` is kept on the first item only: each
+    relink deletes the stored session, so repeating it would discard the
+    link created by the previous item.
+    """
+
+    batch = []
+    for idx, item in enumerate(items):
+        entry = {**payload, **item} if isinstance(item, dict) else {**payload, "send_text": item}
+        if idx:
+            entry.pop("force_relink", None)
+        batch.append(entry)
+    return batch
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Interact with the Go WhatsApp bridge library.")
     parser.add_argument(
         "--lib",
@@ -34,8 +55,20 @@ def main(argv: list[str] | None = None) -> int:
     )
     parser.add_argument(
         "--message",
-        default="Hello from Python!",
-        help="Text message to send (ignored with --read-only).",
+        action="append",
+        default=None,
+        help=(
+            f"Text message to send (default: {DEFAULT_MESSAGE!r}, ignored with --read-only). "
+            "Repeat to send several messages in a single library call."
+        ),
+    )
+    parser.add_argument(
+        "--batch-file",
+        default=None,
+        help=(
+            "JSON file with a list of WaRun payloads (objects or message strings) to execute "
+            "in a single library call; the other options fill in fields the items omit."
+        ),
     )
     parser.add_argument(
         "--read-only",
@@ -54,27 +87,72 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="How long to listen for messages before returning.",
     )
+    parser.add_argument(
+        "--read-chat",
+        default=None,
+        help="Phone or JID of the chat to read with --read-only (defaults to recipient).",
+    )
+    parser.add_argument(
+        "--no-show-qr",
+        dest="show_qr",
+        action="store_false",
+        help="Do not print QR codes when login is required (they are printed by default).",
+    )
+    parser.add_argument(
+        "--force-relink",
+        action="store_true",
+        help="Force the stored session to be cleared and request a new QR link.",
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _PARSER
     args = parser.parse_args(argv)
 
-    lib_path = Path(args.lib)
-    if not lib_path.is_absolute():
-        lib_path = (Path(__file__).resolve().parent / lib_path).resolve()
+    lib_path = args.lib
+    if not os.path.isabs(lib_path):
+        lib_path = os.path.realpath(os.path.join(_SCRIPT_DIR, lib_path))
 
-    if not lib_path.exists():
+    if not os.path.exists(lib_path):
         parser.error(f"shared library not found: {lib_path}")
 
+    if args.batch_file and args.message:
+        parser.error("--message cannot be combined with --batch-file")
+    if args.batch_file and args.read_only:
+        parser.error("--read-only cannot be combined with --batch-file")
+
     try:
         bridge = WhatsAppBridge(lib_path)
-        payload = {}
-        if not args.read_only:
-            payload["send_text"] = args.message
-        if args.read_limit is not None:
-            payload["read_limit"] = args.read_limit
-        if args.listen_seconds is not None:
-            payload["listen_seconds"] = args.listen_seconds
-
-        target = args.recipient or args.account_phone
-        result = bridge.run(args.db_uri, target, payload or None)
+        options = {
+            "filter_chat": (args.read_chat or args.recipient) if args.read_only else args.recipient,
+            "read_limit": args.read_limit,
+            "listen_seconds": args.listen_seconds,
+            "show_qr": None if args.show_qr else False,
+            "force_relink": args.force_relink or None,
+        }
+        payload = {key: value for key, value in options.items() if value is not None}
+
+        messages = [] if args.read_only else (args.message or [DEFAULT_MESSAGE])
+
+        if args.batch_file:
+            with open(args.batch_file, encoding="utf-8") as fh:
+                batch = json.load(fh)
+            if not isinstance(batch, list):
+                parser.error("--batch-file must contain a JSON array of payloads")
+            batch = _build_batch(payload, batch)
+            results = bridge.run_batch(args.db_uri, args.account_phone, batch)
+        elif len(messages) > 1:
+            batch = _build_batch(payload, messages)
+            results = bridge.run_batch(args.db_uri, args.account_phone, batch)
+        else:
+            if messages:
+                payload["send_text"] = messages[0]
+            bridge.bind(args.db_uri, args.account_phone)
+            results = [bridge.run_bound(payload)]
     except BridgeError as exc:  # pragma: no cover - defensive
         print(f"Bridge error: {exc}", file=sys.stderr)
         return 1
@@ -82,23 +160,32 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Error calling library: {exc}", file=sys.stderr)
         return 1
 
-    status = result.get("status")
-    if status != "ok":
-        print(f"Library reported error: {result.get('error', 'unknown error')}", file=sys.stderr)
+    failed = [result for result in results if result.get("status") != "ok"]
+    if failed and len(results) == 1:
+        sys.stderr.write(f"Library reported error: {failed[0].get('error', 'unknown error')}\n")
         return 1
 
-    print("Library call succeeded.")
-    print(f"- Message ID: {result.get('message_id', '<none>')}")
-    print(f"- Login required: {'yes' if result.get('requires_qr') else 'no'}")
-
-    last_messages = result.get("last_messages") or []
-    if last_messages:
-        print("- Session messages:")
-        for idx, msg in enumerate(last_messages, start=1):
-            print(f"  {idx}) {msg}")
-
-    return 0
-
+    if failed:
+        lines = [f"Library call finished with {len(failed)} failed item(s) of {len(results)}."]
+    else:
+        lines = ["Library call succeeded."]
+    for idx, result in enumerate(results, start=1):
+        ok = result.get("status") == "ok"
+        if len(results) > 1:
+            status = "ok" if ok else f"error: {result.get('error', 'unknown error')}"
+            lines.append(f"Item {idx}: {status}")
+        if not ok:
+            continue
+        lines.append(f"- Message ID: {result.get('message_id', '<none>')}")
+        lines.append(f"- Login required: {'yes' if result.get('requires_qr') else 'no'}")
+
+        last_messages = result.get("last_messages") or []
+        if last_messages:
+            lines.append("- Session messages:")
+            lines.extend(f"  {idx}) {msg}" for idx, msg in enumerate(last_messages, start=1))
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 1 if failed else 0
 
 if __name__ == "__main__":
     sys.exit(main())
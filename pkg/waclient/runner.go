@@ -36,6 +36,7 @@ type Config struct {
 	DisableQRPrinting bool
 	IncludeFromMe     bool
 	IncludeFromMeSet  bool
+	ForceRelink       bool
 }
 
 // Result holds the outcome of running the WhatsApp client.
@@ -228,6 +229,15 @@ func Run(ctx context.Context, cfg Config) (*Result, error) {
 		return nil, fmt.Errorf("get device: %w", err)
 	}
 
+	// ForceRelink is destructive: the paired device and its keys are deleted
+	// from the store, so this run (and every later one) needs a new QR link.
+	if cfg.ForceRelink && deviceStore.ID != nil {
+		if err := deviceStore.Delete(ctx); err != nil {
+			return nil, fmt.Errorf("reset session: %w", err)
+		}
+		deviceStore = container.NewDevice()
+	}
+
 	client := whatsmeow.NewClient(deviceStore, log)
 
 	var (
@@ -3,61 +3,193 @@ from __future__ import annotations
 
 import ctypes
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+try:  # optional C-accelerated JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - fallback to the stdlib codec
+    orjson = None
 
 __all__ = ["BridgeError", "WhatsAppBridge"]
 
+# Resolve every symbol at load time instead of on first call; the RTLD_*
+# constants only exist on POSIX and the mode is ignored on Windows.
+_DLOPEN_MODE = getattr(os, "RTLD_NOW", 0) | ctypes.RTLD_LOCAL
+
 
 class BridgeError(RuntimeError):
     """Raised when the Go bridge reports an error status."""
 
 
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:  # pragma: no cover - depends on the installed extras
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+def _read_response(ptr: int, length: Optional[int]) -> Any:
+    """Decode the JSON at ``ptr``; the caller still owns and frees it.
+
+    When ``length`` is known (``WaRunWithLen``) orjson parses the Go buffer
+    in place; otherwise it is copied out with ``string_at`` first.
+    """
+
+    if length is None:
+        return _json_loads(ctypes.string_at(ptr))
+    if orjson is None:  # pragma: no cover - stdlib json needs bytes/str
+        return json.loads(ctypes.string_at(ptr, length))
+    with memoryview((ctypes.c_char * length).from_address(ptr)) as view:
+        return orjson.loads(view)
+
+
+def _encode_arg(value: str | bytes) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return value.encode("utf-8")
+
+
+def _configure_prototypes(lib: ctypes.CDLL) -> None:
+    """Declare the C signatures of the exported functions on ``lib``."""
+
+    lib.WaRun.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
+    # Keep the raw pointer: a ``c_char_p`` restype would copy the buffer
+    # into ``bytes`` and hand ``WaFree`` a pointer it does not own.
+    lib.WaRun.restype = ctypes.c_void_p
+    lib.WaFree.argtypes = [ctypes.c_void_p]
+    lib.WaFree.restype = None
+    wa_run_len = getattr(lib, "WaRunWithLen", None)
+    if wa_run_len is not None:
+        wa_run_len.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_size_t),
+        ]
+        wa_run_len.restype = ctypes.c_void_p
+
+
 class WhatsAppBridge:
     """Thin OO wrapper around the ``libwa`` shared library."""
 
+    # Loaded libraries keyed by real path, shared by all bridge instances.
+    _CACHE: Dict[str, ctypes.CDLL] = {}
+
     def __init__(self, lib_path: str | Path, *, raise_on_error: bool = True) -> None:
-        path = Path(lib_path)
-        if not path.exists():
+        path = os.fspath(lib_path)
+        if not os.path.exists(path):
             raise FileNotFoundError(f"shared library not found: {path}")
 
-        self._lib = ctypes.CDLL(str(path))
-        self._lib.WaRun.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
-        self._lib.WaRun.restype = ctypes.c_char_p
-        self._lib.WaFree.argtypes = [ctypes.c_char_p]
-        self._lib.WaFree.restype = None
+        resolved = os.path.realpath(path)
+        lib = WhatsAppBridge._CACHE.get(resolved)
+        if lib is None:
+            lib = ctypes.CDLL(resolved, mode=_DLOPEN_MODE)
+            _configure_prototypes(lib)
+            WhatsAppBridge._CACHE[resolved] = lib
+
+        self._lib = lib
+        # Bound once so calls skip the CDLL attribute lookup.
+        self._wa_run = lib.WaRun
+        self._wa_free = lib.WaFree
+        # Libraries built before WaRunWithLen existed only export WaRun.
+        self._wa_run_len = getattr(lib, "WaRunWithLen", None)
         self._raise_on_error = raise_on_error
+        self._db_uri_b: Optional[bytes] = None
+        self._phone_b: Optional[bytes] = None
+
+    def bind(self, db_uri: str | bytes, phone: str | bytes) -> None:
+        """Remember ``db_uri`` and ``phone`` for subsequent :meth:`run_bound` calls."""
+
+        self._db_uri_b = _encode_arg(db_uri)
+        self._phone_b = _encode_arg(phone)
 
     def run(
         self,
-        db_uri: str,
-        phone: str,
-        payload: Optional[Dict[str, Any] | str] = None,
+        db_uri: str | bytes,
+        phone: str | bytes,
+        payload: Optional[Dict[str, Any] | str | bytes] = None,
     ) -> Dict[str, Any]:
-        """Invoke the shared library with an optional JSON payload."""
+        """Invoke the shared library with an optional JSON payload.
 
-        message: str
-        if payload is None:
-            message = ""
-        elif isinstance(payload, str):
+        ``db_uri``, ``phone`` and a pre-serialised ``payload`` may be passed
+        as UTF-8 ``bytes`` to skip re-encoding them on every call.
+        """
+
+        return self._call(_encode_arg(db_uri), _encode_arg(phone), payload)
+
+    def run_bound(
+        self,
+        payload: Optional[Dict[str, Any] | str | bytes] = None,
+    ) -> Dict[str, Any]:
+        """Like :meth:`run`, using the session set up by :meth:`bind`."""
+
+        if self._db_uri_b is None or self._phone_b is None:
+            raise RuntimeError("bridge is not bound; call bind() first")
+        return self._call(self._db_uri_b, self._phone_b, payload)
+
+    def run_batch(
+        self,
+        db_uri: str | bytes,
+        phone: str | bytes,
+        payloads: Sequence[Dict[str, Any] | str],
+    ) -> List[Dict[str, Any]]:
+        """Execute several payloads with a single ``WaRun`` call.
+
+        Returns one result per payload, in order. Failures of individual
+        items are reported through their ``status``/``error`` fields.
+        """
+
+        if not payloads:
+            return []
+
+        result = self._call(
+            _encode_arg(db_uri),
+            _encode_arg(phone),
+            {"batch": list(payloads)},
+        )
+        results = result.get("results")
+        if results is None:
+            raise BridgeError(result.get("error") or "library does not support batch requests")
+        return results
+
+    def _call(
+        self,
+        db_uri: bytes,
+        phone: bytes,
+        payload: Optional[Dict[str, Any] | str | bytes],
+    ) -> Dict[str, Any]:
+        message: bytes
+        if not payload:
+            # None, {} and "" all mean "no payload" to the Go side.
+            message = b""
+        elif isinstance(payload, bytes):
             message = payload
+        elif isinstance(payload, str):
+            message = payload.encode("utf-8")
         else:
-            message = json.dumps(payload, ensure_ascii=False)
+            message = _json_dumps(payload)
 
-        ptr = self._lib.WaRun(
-            db_uri.encode("utf-8"),
-            phone.encode("utf-8"),
-            message.encode("utf-8"),
-        )
+        if self._wa_run_len is None:
+            ptr = self._wa_run(db_uri, phone, message)
+            length = None
+        else:
+            out_len = ctypes.c_size_t(0)
+            ptr = self._wa_run_len(db_uri, phone, message, ctypes.byref(out_len))
+            length = out_len.value
         if not ptr:
             raise RuntimeError("library returned NULL pointer")
 
         try:
-            raw = ctypes.string_at(ptr).decode("utf-8")
+            result: Dict[str, Any] = _read_response(ptr, length)
         finally:
-            self._lib.WaFree(ptr)
+            self._wa_free(ptr)
 
-        result: Dict[str, Any] = json.loads(raw)
         if self._raise_on_error and result.get("status") != "ok":
             raise BridgeError(result.get("error", "unknown bridge error"))
         return result
@@ -65,35 +197,47 @@ class WhatsAppBridge:
     def send_message(
         self,
         db_uri: str,
-        phone: str,
+        account_phone: str,
+        recipient: str,
         text: str,
         *,
         read_limit: Optional[int] = None,
         listen_seconds: Optional[float] = None,
+        show_qr: Optional[bool] = None,
+        force_relink: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Send ``text`` to ``phone`` and optionally listen for replies."""
-
-        payload: Dict[str, Any] = {"send_text": text}
-        if read_limit is not None:
-            payload["read_limit"] = read_limit
-        if listen_seconds is not None:
-            payload["listen_seconds"] = listen_seconds
-        return self.run(db_uri, phone, payload)
+        """Send ``text`` to ``recipient`` and optionally listen for replies."""
+
+        options = {
+            "send_text": text,
+            "filter_chat": recipient,
+            "read_limit": read_limit,
+            "listen_seconds": listen_seconds,
+            "show_qr": show_qr,
+            "force_relink": force_relink or None,
+        }
+        payload = {key: value for key, value in options.items() if value is not None}
+        return self.run(db_uri, account_phone, payload)
 
     def read_messages(
         self,
         db_uri: str,
-        phone: str,
+        account_phone: str,
+        read_chat: Optional[str] = None,
         *,
         read_limit: Optional[int] = None,
         listen_seconds: Optional[float] = None,
+        show_qr: Optional[bool] = None,
+        force_relink: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Listen to incoming messages without sending anything."""
-
-        payload: Dict[str, Any] = {}
-        if read_limit is not None:
-            payload["read_limit"] = read_limit
-        if listen_seconds is not None:
-            payload["listen_seconds"] = listen_seconds
-        return self.run(db_uri, phone, payload if payload else None)
-
+        """Listen to incoming messages of ``read_chat`` without sending anything."""
+
+        options = {
+            "filter_chat": read_chat,
+            "read_limit": read_limit,
+            "listen_seconds": listen_seconds,
+            "show_qr": show_qr,
+            "force_relink": force_relink or None,
+        }
+        payload = {key: value for key, value in options.items() if value is not None}
+        return self.run(db_uri, account_phone, payload)
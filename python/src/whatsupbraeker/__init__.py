@@ -1,19 +1,25 @@
 """High-level Python bindings for the WhatsUpBraeker Go bridge.
 
 The package bundles the compiled ``libwa`` shared library and exposes a
-minimal wrapper around its ``WaRun`` and ``WaFree`` functions.
+minimal wrapper around its ``WaRun``/``WaRunWithLen`` and ``WaFree`` functions.
 """
 
 from __future__ import annotations
 
 import ctypes
 import json
+import os
 import platform
 from dataclasses import dataclass
 from importlib import resources
 from pathlib import Path
 from typing import Any, Mapping, MutableMapping, Optional, Union
 
+try:  # optional C-accelerated JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - fallback to the stdlib codec
+    orjson = None
+
 __all__ = [
     "LibraryLoadError",
     "WaBridge",
@@ -21,7 +27,7 @@ __all__ = [
     "run",
 ]
 
-__version__ = "0.3.1"
+__version__ = "0.4.0"
 
 _LIB_EXTENSIONS = {
     "Darwin": ".dylib",
@@ -29,6 +35,11 @@ _LIB_EXTENSIONS = {
     "Windows": ".dll",
 }
 
+_DLOPEN_MODE = getattr(os, "RTLD_NOW", 0) | ctypes.RTLD_LOCAL
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class LibraryLoadError(RuntimeError):
     """Raised when the bundled shared library cannot be located or loaded."""
@@ -69,32 +80,67 @@ class WaResult:
 class WaBridge:
     """Thin wrapper around the exported C functions."""
 
+    _CACHE: dict[str, ctypes.CDLL] = {}
+
     def __init__(self, library: Optional[Union[str, Path]] = None) -> None:
-        path = _resolve_library_path(library)
-        self._lib = ctypes.CDLL(str(path))
-        self._lib.WaRun.argtypes = [
-            ctypes.c_char_p,
-            ctypes.c_char_p,
-            ctypes.c_char_p,
-        ]
-        self._lib.WaRun.restype = ctypes.c_char_p
-        self._lib.WaFree.argtypes = [ctypes.c_char_p]
-        self._lib.WaFree.restype = None
+        path = str(_resolve_library_path(library))
+        lib = WaBridge._CACHE.get(path)
+        if lib is None:
+            lib = ctypes.CDLL(path, mode=_DLOPEN_MODE)
+            _configure_prototypes(lib)
+            WaBridge._CACHE[path] = lib
+
+        self._lib = lib
+        self._wa_run = lib.WaRun
+        self._wa_free = lib.WaFree
+        self._wa_run_len = getattr(lib, "WaRunWithLen", None)
 
     def run(self, db_uri: str, account_phone: str, message: str) -> WaResult:
         """Call the Go bridge and return the structured response."""
-        ptr = self._lib.WaRun(
+        args = (
             db_uri.encode("utf-8"),
             account_phone.encode("utf-8"),
             message.encode("utf-8"),
         )
+        if self._wa_run_len is None:
+            ptr = self._wa_run(*args)
+            length = None
+        else:
+            out_len = ctypes.c_size_t(0)
+            ptr = self._wa_run_len(*args, ctypes.byref(out_len))
+            length = out_len.value
         if not ptr:
             raise RuntimeError("WaRun returned NULL")
         try:
-            raw = ctypes.string_at(ptr).decode("utf-8")
+            data = _read_response(ptr, length)
         finally:
-            self._lib.WaFree(ptr)
-        return WaResult.from_mapping(json.loads(raw))
+            self._wa_free(ptr)
+        return WaResult.from_mapping(data)
+
+
+def _read_response(ptr: int, length: Optional[int]) -> Any:
+    if length is None:
+        return _json_loads(ctypes.string_at(ptr))
+    if orjson is None:  # pragma: no cover - depends on the installed extras
+        return json.loads(ctypes.string_at(ptr, length))
+    with memoryview((ctypes.c_char * length).from_address(ptr)) as view:
+        return orjson.loads(view)
+
+
+def _configure_prototypes(lib: ctypes.CDLL) -> None:
+    lib.WaRun.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
+    lib.WaRun.restype = ctypes.c_void_p
+    lib.WaFree.argtypes = [ctypes.c_void_p]
+    lib.WaFree.restype = None
+    wa_run_len = getattr(lib, "WaRunWithLen", None)
+    if wa_run_len is not None:
+        wa_run_len.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_size_t),
+        ]
+        wa_run_len.restype = ctypes.c_void_p
 
 
 def _resolve_library_path(candidate: Optional[Union[str, Path]]) -> Path:
@@ -5,13 +5,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
 
 from python import BridgeError, WhatsAppBridge
 
+_SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Send a WhatsApp message via the Go bridge library.",
     )
@@ -56,61 +58,52 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="How long to listen for messages (fractional seconds allowed).",
     )
-    parser.add_argument(
-        "--read-only",
-        action="store_true",
-        help="Skip sending a message and only collect incoming messages.",
-    )
-    parser.add_argument(
-        "--read-limit",
-        type=int,
-        default=None,
-        help="Maximum number of messages to collect (default is library-controlled).",
-    )
-    parser.add_argument(
-        "--listen-seconds",
-        type=float,
-        default=None,
-        help="How long to listen for messages (fractional seconds allowed).",
-    )
     parser.add_argument(
         "--read-chat",
         default=None,
         help="Phone or JID of the chat to collect messages from (defaults to recipient).",
     )
     parser.add_argument(
-        "--show-qr",
-        action="store_true",
-        help="Print QR codes when login is required.",
+        "--no-show-qr",
+        dest="show_qr",
+        action="store_false",
+        help="Do not print QR codes when login is required (they are printed by default).",
     )
     parser.add_argument(
         "--force-relink",
         action="store_true",
         help="Force the stored session to be cleared and request a new QR link.",
     )
-    args = parser.parse_args(argv)
-    return parser, args
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return _PARSER.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser, args = parse_args(argv)
+    args = parse_args(argv)
 
-    lib_path = Path(args.lib)
-    if not lib_path.is_absolute():
-        lib_path = (Path(__file__).resolve().parent / lib_path).resolve()
+    lib_path = args.lib
+    if not os.path.isabs(lib_path):
+        lib_path = os.path.realpath(os.path.join(_SCRIPT_DIR, lib_path))
 
     try:
         bridge = WhatsAppBridge(lib_path)
-        payload = {}
-        if not args.read_only:
-            payload["send_text"] = args.message
-        if args.read_limit is not None:
-            payload["read_limit"] = args.read_limit
-        if args.listen_seconds is not None:
-            payload["listen_seconds"] = args.listen_seconds
-
-        request_payload = payload or None
-        result = bridge.run(args.db_uri, args.phone, request_payload)
+        options = {
+            "send_text": None if args.read_only else args.message,
+            "filter_chat": (args.read_chat or args.recipient) if args.read_only else args.recipient,
+            "read_limit": args.read_limit,
+            "listen_seconds": args.listen_seconds,
+            "show_qr": None if args.show_qr else False,
+            "force_relink": args.force_relink or None,
+        }
+        payload = {key: value for key, value in options.items() if value is not None}
+
+        result = bridge.run(args.db_uri, args.account_phone, payload)
     except BridgeError as exc:  # pragma: no cover
         print(f"Bridge error: {exc}", file=sys.stderr)
         return 1
@@ -123,16 +116,18 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Bridge error: {result.get('error', 'unknown error')}", file=sys.stderr)
         return 1
 
-    print("WhatsApp bridge call succeeded.")
-    print(f"- Message ID: {result.get('message_id', '<none>')}")
-    print(f"- Login required: {'yes' if result.get('requires_qr') else 'no'}")
+    lines = [
+        "WhatsApp bridge call succeeded.",
+        f"- Message ID: {result.get('message_id', '<none>')}",
+        f"- Login required: {'yes' if result.get('requires_qr') else 'no'}",
+    ]
 
     last_messages = result.get("last_messages") or []
     if last_messages:
-        print("- Session messages:")
-        for idx, msg in enumerate(last_messages, start=1):
-            print(f"  {idx}) {msg}")
+        lines.append("- Session messages:")
+        lines.extend(f"  {idx}) {msg}" for idx, msg in enumerate(last_messages, start=1))
 
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -0,0 +1,115 @@
+"""Tests for the example command-line client (examples/python/client.py)."""
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+sys.path.insert(0, os.path.join(_ROOT, "examples", "python"))
+
+import client  # noqa: E402
+
+
+class _FakeBridge:
+    """Stand-in for WhatsAppBridge that records batch payloads."""
+
+    batches: list[list[dict]] = []
+
+    def __init__(self, lib_path: str) -> None:
+        self.lib_path = lib_path
+
+    def run_batch(self, db_uri: str, phone: str, payloads: list[dict]) -> list[dict]:
+        _FakeBridge.batches.append(payloads)
+        return [{"status": "ok", "message_id": str(idx)} for idx, _ in enumerate(payloads)]
+
+
+class BuildBatchTests(unittest.TestCase):
+    def test_item_fields_override_cli_defaults(self) -> None:
+        batch = client._build_batch(
+            {"filter_chat": "1", "read_limit": 3},
+            [{"send_text": "a", "read_limit": 9}, "b"],
+        )
+        self.assertEqual(
+            batch,
+            [
+                {"filter_chat": "1", "read_limit": 9, "send_text": "a"},
+                {"filter_chat": "1", "read_limit": 3, "send_text": "b"},
+            ],
+        )
+
+    def test_force_relink_only_on_first_item(self) -> None:
+        batch = client._build_batch(
+            {"force_relink": True},
+            ["a", {"send_text": "b", "force_relink": True}, "c"],
+        )
+        self.assertTrue(batch[0]["force_relink"])
+        self.assertNotIn("force_relink", batch[1])
+        self.assertNotIn("force_relink", batch[2])
+
+
+class MainBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _FakeBridge.batches = []
+        patcher = mock.patch.object(client, "WhatsAppBridge", _FakeBridge)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        lib = tempfile.NamedTemporaryFile(suffix=".so", delete=False)
+        lib.close()
+        self.addCleanup(os.unlink, lib.name)
+        self.lib = lib.name
+
+    def _main(self, *argv: str) -> int:
+        with mock.patch("sys.stdout"), mock.patch("sys.stderr"):
+            return client.main(["--lib", self.lib, "--account-phone", "1", *argv])
+
+    def test_repeated_messages_relink_once(self) -> None:
+        code = self._main("--message", "a", "--message", "b", "--recipient", "2", "--force-relink")
+        self.assertEqual(code, 0)
+        (batch,) = _FakeBridge.batches
+        self.assertEqual([item["send_text"] for item in batch], ["a", "b"])
+        self.assertTrue(batch[0]["force_relink"])
+        self.assertNotIn("force_relink", batch[1])
+
+    def test_batch_file_relinks_once(self) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+            json.dump([{"send_text": "a"}, {"send_text": "b"}], fh)
+        self.addCleanup(os.unlink, fh.name)
+
+        code = self._main("--batch-file", fh.name, "--force-relink")
+        self.assertEqual(code, 0)
+        (batch,) = _FakeBridge.batches
+        self.assertTrue(batch[0]["force_relink"])
+        self.assertNotIn("force_relink", batch[1])
+
+    def test_batch_file_rejects_read_only(self) -> None:
+        with self.assertRaises(SystemExit):
+            self._main("--batch-file", "items.json", "--read-only")
+        self.assertEqual(_FakeBridge.batches, [])
+
+    def test_batch_reports_every_item_on_failure(self) -> None:
+        results = [
+            {"status": "ok", "message_id": "MSG-1"},
+            {"status": "error", "error": "boom"},
+        ]
+        with mock.patch.object(_FakeBridge, "run_batch", return_value=results), mock.patch(
+            "sys.stdout", new_callable=io.StringIO
+        ) as stdout:
+            code = client.main(
+                ["--lib", self.lib, "--account-phone", "1", "--message", "a", "--message", "b"]
+            )
+
+        self.assertEqual(code, 1)
+        output = stdout.getvalue()
+        self.assertIn("Item 1: ok", output)
+        self.assertIn("MSG-1", output)
+        self.assertIn("Item 2: error: boom", output)
+
+
+if __name__ == "__main__":
+    unittest.main()